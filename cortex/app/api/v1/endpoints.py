@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, Header, status
 from pydantic import BaseModel, field_validator
 import os
+import logging
+import threading
 import joblib
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import keras
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -14,11 +15,14 @@ from cortex.app.core.database import get_db
 from cortex.app.core.models import PredictionAudit
 from cortex.app.engine.auditor import calculate_trust_label
 from cortex.app.engine.fetcher import fetch_data
+from cortex.app.engine.inference import LSTMForecaster
+from cortex.app.engine.store import load_history, warm_history
 
 router = APIRouter()
 logger = logging.getLogger("cortex.api")
 
 MODEL_CACHE = {}
+MODEL_CACHE_LOCK = threading.Lock()
 SUPPORTED_CURRENCIES = {
     "GBP", "CHF", "USD", "INR", "JPY", "CZK", "DKK", "HUF", "PLN", "RON", 
     "SEK", "ISK", "NOK", "TRY", "AUD", "BRL", "CAD", "CNY", "HKD", "IDR", 
@@ -34,8 +38,21 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # MODEL_DIR = os.path.join(BASE_DIR, "../../../models")
 MODEL_DIR = "/app/cortex/models"
 
-def get_model_prediction(target_curr: str, days: int, window_size: int = 180):
-    if target_curr == "EUR": return None, None
+def load_pair(target_curr: str):
+    # The gunicorn master preloads every pair, so forked workers find them here
+    # already (copy-on-write). Pairs added later are loaded once per process.
+    cached = MODEL_CACHE.get(target_curr)
+    if cached:
+        return cached
+
+    # Sync endpoints run in a thread pool: make concurrent first requests wait
+    # for a single load instead of each loading its own copy.
+    with MODEL_CACHE_LOCK:
+        if target_curr in MODEL_CACHE:
+            return MODEL_CACHE[target_curr]
+        return _load_pair_from_disk(target_curr)
+
+def _load_pair_from_disk(target_curr: str):
     pair_code = f"EUR_{target_curr}"
     model_path = os.path.join(MODEL_DIR, f"{pair_code}.keras")
     scaler_path = os.path.join(MODEL_DIR, f"{pair_code}_scaler.joblib")
@@ -47,9 +64,37 @@ def get_model_prediction(target_curr: str, days: int, window_size: int = 180):
             detail=f"Model for {pair_code} not initialized."
         )
 
-    model = keras.models.load_model(model_path)
-    scaler = joblib.load(scaler_path)
-    df = fetch_data(f"EUR{target_curr}")
+    MODEL_CACHE[target_curr] = (LSTMForecaster.load(model_path), joblib.load(scaler_path))
+    return MODEL_CACHE[target_curr]
+
+def preload():
+    # Runs once in the gunicorn master (preload_app) before workers are forked.
+    currencies = sorted(SUPPORTED_CURRENCIES - {"EUR"})
+    warm_history(currencies)
+    for currency in currencies:
+        try:
+            load_pair(currency)
+        except HTTPException as e:
+            logger.warning(f"Preload skipped EUR_{currency}: {e.detail}")
+
+def warm_worker():
+    # Runs in each worker after fork. Preloaded pairs are already cached; this
+    # only maps the history files already stored and loads anything the master
+    # missed. It never fetches: that is left to requests, so a slow ECB can't
+    # keep the worker from starting (see timeout in gunicorn_conf.py).
+    for currency in sorted(SUPPORTED_CURRENCIES - {"EUR"}):
+        try:
+            load_pair(currency)
+        except HTTPException:
+            pass
+        load_history(currency, refresh=False)
+
+def get_model_prediction(target_curr: str, days: int, window_size: int = 180):
+    if target_curr == "EUR": return None, None
+    pair_code = f"EUR_{target_curr}"
+
+    model, scaler = load_pair(target_curr)
+    df = load_history(target_curr)
     
     if df is None or len(df) < window_size:
         raise ValueError(f"Insufficient history for {pair_code}")
@@ -65,7 +110,7 @@ def get_model_prediction(target_curr: str, days: int, window_size: int = 180):
     predicted_prices = []
     current_price = latest_price
     for _ in range(days):
-        pred_scaled = model.predict(current_batch, verbose=0)[0, 0]
+        pred_scaled = model.predict(current_batch)[0, 0]
         pred_return = scaler.inverse_transform([[pred_scaled]])[0, 0]
         current_price = current_price * (1 + pred_return)
         predicted_prices.append(current_price)
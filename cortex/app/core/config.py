@@ -0,0 +1,12 @@
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Shared on-disk state. Every API worker must resolve these to the SAME paths,
+# so the HTTP caches and the history store are written once and read by all.
+DATA_DIR = os.getenv("CORTEX_DATA_DIR", os.path.abspath(os.path.join(BASE_DIR, "../../data")))
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+HISTORY_DIR = os.path.join(DATA_DIR, "history")
+
+os.makedirs(CACHE_DIR, exist_ok=True)
+os.makedirs(HISTORY_DIR, exist_ok=True)
@@ -1,9 +1,11 @@
 import pandas as pd
 import requests
 import io
+import os
 import logging
 import requests_cache
 from datetime import timedelta
+from cortex.app.core.config import CACHE_DIR
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -11,8 +13,12 @@ logger = logging.getLogger(__name__)
 
 # SETUP CACHING FOR ECB RESPONSES
 # Stores ECB responses for 1 hour to prevent redundant network calls.
+# One SQLite file in CACHE_DIR is shared by every API worker; WAL mode lets
+# them read concurrently while one of them writes.
 session = requests_cache.CachedSession(
-    'ecb_cache',
+    os.path.join(CACHE_DIR, 'ecb_cache'),
+    backend='sqlite',
+    wal=True,
     expire_after=timedelta(hours=1) 
 )
 
@@ -23,7 +29,10 @@ session.headers.update({
     "Accept": "text/csv"
 })
 
-def fetch_data(ticker: str, start_date: str = "2000-01-01"):
+# Seconds to wait on the ECB before giving up, so a hung call can't pin a worker.
+REQUEST_TIMEOUT = 30
+
+def fetch_data(ticker: str, start_date: str = "2000-01-01", timeout: float = REQUEST_TIMEOUT):
 
     # Parse the target currency from the ticker
     # assume the input is always EUR vs X.
@@ -51,7 +60,7 @@ def fetch_data(ticker: str, start_date: str = "2000-01-01"):
     }
     
     try:
-        response = session.get(url, params=params)
+        response = session.get(url, params=params, timeout=timeout)
         
         if response.status_code != 200:
             logger.warning(f"ECB API returned {response.status_code} for {target_currency}")
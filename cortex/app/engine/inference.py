@@ -0,0 +1,101 @@
+import json
+import zipfile
+import h5py
+import numpy as np
+
+# Forward pass of the trained LSTM models (see model.build_model) in plain NumPy.
+#
+# The weights are read straight out of the .keras archive, so the API never has
+# to start the TensorFlow runtime. That keeps it fork-safe: the gunicorn master
+# loads every model once and the workers share the arrays copy-on-write.
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+_ACTIVATIONS = {"sigmoid": _sigmoid, "tanh": np.tanh, "linear": lambda x: x}
+
+
+def _weights_key(class_name: str, seen: dict) -> str:
+    # Keras names the weight groups by layer type in order: lstm, lstm_1, dense, ...
+    base = {"LSTM": "lstm", "Dense": "dense", "Dropout": "dropout"}[class_name]
+    count = seen.get(base, 0)
+    seen[base] = count + 1
+    return base if count == 0 else f"{base}_{count}"
+
+
+class LSTMForecaster:
+    """Inference-only copy of a saved Sequential LSTM -> ... -> Dense model."""
+
+    def __init__(self, layers: list):
+        self.layers = layers
+
+    @classmethod
+    def load(cls, model_path: str):
+        with zipfile.ZipFile(model_path) as archive:
+            config = json.loads(archive.read("config.json"))
+            with archive.open("model.weights.h5") as f, h5py.File(f, "r") as weights:
+                layers, seen = [], {}
+                for layer in config["config"]["layers"]:
+                    class_name, layer_config = layer["class_name"], layer["config"]
+                    if class_name == "InputLayer":
+                        continue
+                    if class_name not in ("LSTM", "Dense", "Dropout"):
+                        raise ValueError(f"Unsupported layer {class_name} in {model_path}")
+
+                    key = _weights_key(class_name, seen)
+                    if class_name == "Dropout":
+                        # No-op at inference time.
+                        continue
+                    if class_name == "LSTM":
+                        group = weights[f"layers/{key}/cell/vars"]
+                        layers.append({
+                            "type": "lstm",
+                            "kernel": np.array(group["0"]),
+                            "recurrent_kernel": np.array(group["1"]),
+                            "bias": np.array(group["2"]),
+                            "activation": _ACTIVATIONS[layer_config["activation"]],
+                            "recurrent_activation": _ACTIVATIONS[layer_config["recurrent_activation"]],
+                            "return_sequences": layer_config["return_sequences"],
+                        })
+                    else:
+                        group = weights[f"layers/{key}/vars"]
+                        layers.append({
+                            "type": "dense",
+                            "kernel": np.array(group["0"]),
+                            "bias": np.array(group["1"]),
+                            "activation": _ACTIVATIONS[layer_config["activation"]],
+                        })
+        return cls(layers)
+
+    @staticmethod
+    def _lstm(layer, x):
+        # x: (batch, steps, features). Gate order matches Keras: input, forget, cell, output.
+        batch, steps, _ = x.shape
+        units = layer["recurrent_kernel"].shape[0]
+        act, rec_act = layer["activation"], layer["recurrent_activation"]
+
+        # Input projections for every step at once; only the recurrence is sequential.
+        projected = x @ layer["kernel"] + layer["bias"]
+        h = np.zeros((batch, units), dtype=x.dtype)
+        c = np.zeros((batch, units), dtype=x.dtype)
+        outputs = []
+        for t in range(steps):
+            z = projected[:, t, :] + h @ layer["recurrent_kernel"]
+            i = rec_act(z[:, :units])
+            f = rec_act(z[:, units:2 * units])
+            c = f * c + i * act(z[:, 2 * units:3 * units])
+            h = rec_act(z[:, 3 * units:]) * act(c)
+            if layer["return_sequences"]:
+                outputs.append(h)
+        return np.stack(outputs, axis=1) if layer["return_sequences"] else h
+
+    def predict(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        for layer in self.layers:
+            if layer["type"] == "lstm":
+                x = self._lstm(layer, x)
+            else:
+                x = layer["activation"](x @ layer["kernel"] + layer["bias"])
+        return x
@@ -4,6 +4,8 @@ from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import requests_cache
 from datetime import timedelta
 import logging
+import os
+from cortex.app.core.config import CACHE_DIR
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -15,7 +17,13 @@ except LookupError:
     nltk.download('vader_lexicon')
 
 # Cache for sentiment
-session = requests_cache.CachedSession('sentiment_cache', expire_after=timedelta(hours=1))
+# One SQLite file in CACHE_DIR is shared by every API worker (WAL mode).
+session = requests_cache.CachedSession(
+    os.path.join(CACHE_DIR, 'sentiment_cache'),
+    backend='sqlite',
+    wal=True,
+    expire_after=timedelta(hours=1)
+)
 
 def get_market_sentiment(pair_code: str):
     try:
@@ -0,0 +1,128 @@
+import os
+import time
+import fcntl
+import logging
+import numpy as np
+import pandas as pd
+from datetime import timedelta
+from cortex.app.core.config import HISTORY_DIR
+from cortex.app.engine.fetcher import fetch_data, REQUEST_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Same lifetime as the ECB response cache.
+HISTORY_TTL = timedelta(hours=1)
+# After a failed refresh, wait this long before any worker tries the ECB again.
+# Without a stored copy the pair can't be served at all, so retry sooner.
+RETRY_AFTER = timedelta(minutes=5)
+RETRY_AFTER_NO_COPY = timedelta(seconds=30)
+
+# Per-process view of the store: {currency: (file mtime, DataFrame over the mmap)}
+_MAPPED = {}
+
+
+def _history_path(target_currency: str) -> str:
+    return os.path.join(HISTORY_DIR, f"EUR_{target_currency}.npy")
+
+
+def _younger_than(path: str, age: timedelta) -> bool:
+    try:
+        elapsed = time.time() - os.path.getmtime(path)
+    except FileNotFoundError:
+        return False
+    return elapsed < age.total_seconds()
+
+
+def _write_history(target_currency: str, df: pd.DataFrame):
+    # One (2, n) int64 array per pair: row 0 = dates as datetime64[s],
+    # row 1 = Close as float64 bits. Both rows are viewed in place on load.
+    # Written to a temp file and renamed, so readers never see a partial file and
+    # workers still mapping the old version keep a valid view until they reopen.
+    dates = df.index.values.astype("datetime64[s]").view(np.int64)
+    close = df["Close"].values.astype(np.float64).view(np.int64)
+    data = np.vstack([dates, close])
+
+    path = _history_path(target_currency)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, data)
+    os.replace(tmp_path, path)
+
+
+def _backing_off(path: str) -> bool:
+    retry_after = RETRY_AFTER if os.path.exists(path) else RETRY_AFTER_NO_COPY
+    return _younger_than(f"{path}.failed", retry_after)
+
+
+def refresh_history(target_currency: str, timeout: float = REQUEST_TIMEOUT) -> bool:
+    """Fetch full ECB history for one pair into the shared store if it is stale."""
+    path = _history_path(target_currency)
+    failed_marker = f"{path}.failed"
+    if _younger_than(path, HISTORY_TTL):
+        return True
+    if _backing_off(path):
+        return os.path.exists(path)
+
+    has_copy = os.path.exists(path)
+    with open(f"{path}.lock", "w") as lock:
+        # Serialise refreshes across workers. With a stale copy on disk, nobody
+        # waits: if another worker is already fetching, serve the stale copy.
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | (fcntl.LOCK_NB if has_copy else 0))
+        except BlockingIOError:
+            return True
+        try:
+            if _younger_than(path, HISTORY_TTL):
+                return True
+            if _backing_off(path):
+                return os.path.exists(path)
+            df = fetch_data(f"EUR{target_currency}", timeout=timeout)
+            if df is None or df.empty:
+                # Back off, and keep serving the previous copy (if any) meanwhile.
+                with open(failed_marker, "w"):
+                    pass
+                return os.path.exists(path)
+            _write_history(target_currency, df)
+            try:
+                os.remove(failed_marker)
+            except FileNotFoundError:
+                pass
+            return True
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_history(target_currency: str, refresh: bool = True):
+    """
+    Full daily history for EUR -> target_currency, read-only.
+
+    Both the index and the Close column are views over a memory-mapped file,
+    so every worker process reads the same physical pages. With refresh=False
+    only what is already stored is mapped; nothing is fetched.
+    """
+    path = _history_path(target_currency)
+    if refresh and not refresh_history(target_currency):
+        return None
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.path.getmtime(path)
+    cached = _MAPPED.get(target_currency)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    data = np.load(path, mmap_mode="r")
+    index = pd.DatetimeIndex(data[0].view("datetime64[s]"), name="Date", copy=False)
+    df = pd.DataFrame({"Close": data[1].view(np.float64)}, index=index, copy=False)
+
+    _MAPPED[target_currency] = (mtime, df)
+    return df
+
+
+def warm_history(currencies, timeout: float = 10):
+    """Populate the store for every pair, e.g. in the gunicorn master before forking."""
+    for currency in currencies:
+        if currency == "EUR":
+            continue
+        if not refresh_history(currency, timeout=timeout):
+            logger.warning(f"No history stored for EUR{currency}; workers will retry on demand.")
@@ -0,0 +1,60 @@
+# Multi-worker deployment:
+#   gunicorn -c cortex/gunicorn_conf.py cortex.app.main:app
+#
+# The app is imported once in the master (preload_app), which also fills the
+# shared history store and loads every model's weights as NumPy arrays. Workers
+# are then forked from it and share those pages copy-on-write. The API never
+# starts TensorFlow (see engine/inference.py), so forking after preload is safe.
+import gc
+import os
+import sys
+
+bind = os.getenv("CORTEX_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+# Workers are killed if silent for this long, including during post_worker_init,
+# so that hook only does local work (no ECB fetches).
+timeout = 120
+# Set CORTEX_PRELOAD_APP=0 to have every worker load everything itself (for comparison).
+preload_app = os.getenv("CORTEX_PRELOAD_APP", "1") == "1"
+
+
+def _close_http_caches():
+    # requests-cache opens its SQLite connection as soon as a session is built.
+    # A connection must never cross fork(): close it so each process reopens its own.
+    for module_name in ("cortex.app.engine.fetcher", "cortex.app.engine.sentiment"):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            module.session.cache.responses.close()
+            module.session.cache.redirects.close()
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+
+    from cortex.app.api.v1.endpoints import preload
+
+    preload()
+    _close_http_caches()
+
+    # Move everything loaded so far out of the GC's reach, so collections in the
+    # workers don't write to (and un-share) the inherited pages.
+    gc.freeze()
+    server.log.info(f"Cortex preloaded, forking {workers} worker(s).")
+
+
+def post_fork(server, worker):
+    from cortex.app.core.database import engine
+
+    # The master opened DB connections at import (create_all); never reuse them across processes.
+    engine.dispose(close=False)
+    _close_http_caches()
+
+
+def post_worker_init(worker):
+    from cortex.app.api.v1.endpoints import warm_worker
+
+    # Map every stored history file (and load any model the master didn't have)
+    # up front, so each worker reaches its steady-state footprint before serving.
+    warm_worker()
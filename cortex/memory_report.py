@@ -0,0 +1,134 @@
+# Memory report for the multi-worker deployment (Linux only, reads /proc).
+#
+#   python -m cortex.memory_report --workers 1 2 4
+#
+# For each worker count it starts gunicorn with gunicorn_conf.py, once with the
+# app preloaded in the master and once without (CORTEX_PRELOAD_APP=0). Every
+# worker warms all pairs in post_worker_init; the script then sends concurrent
+# /predict requests covering all 29 currencies and prints RSS and PSS per worker.
+# RSS counts shared pages in full for every process; PSS splits them between the
+# processes sharing them, so total PSS is the real footprint.
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+CONF_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gunicorn_conf.py")
+
+
+def read_memory_kb(pid: int) -> dict:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                values[parts[0][:-1]] = int(parts[1])
+    return values
+
+
+def child_pids(pid: int) -> list:
+    children = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{task}/children") as f:
+            children.extend(int(c) for c in f.read().split())
+    return children
+
+
+def wait_until_online(base_url: str, timeout: float = 300):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/", timeout=5) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(1)
+    raise RuntimeError("Cortex did not come online in time.")
+
+
+def send_prediction(base_url: str, pair: tuple):
+    from_curr, to_curr = pair
+    body = json.dumps({"from_currency": from_curr, "to_currency": to_curr, "days": 5}).encode()
+    request = urllib.request.Request(
+        f"{base_url}/api/v1/predict", data=body, headers={"Content-Type": "application/json"}
+    )
+    try:
+        urllib.request.urlopen(request, timeout=120).read()
+        return True
+    except OSError as e:
+        print(f"  request {from_curr}->{to_curr} failed: {e}")
+        return False
+
+
+def send_predictions(base_url: str, rounds: int, concurrency: int, pairs: list) -> int:
+    # Concurrent connections so the load spreads over all workers, not just whichever accepts first.
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = pool.map(lambda pair: send_prediction(base_url, pair), pairs * rounds)
+        return sum(results)
+
+
+def measure(worker_count: int, preload: bool, port: int, rounds: int, pairs: list) -> dict:
+    env = dict(
+        os.environ,
+        WEB_CONCURRENCY=str(worker_count),
+        CORTEX_BIND=f"127.0.0.1:{port}",
+        CORTEX_PRELOAD_APP="1" if preload else "0",
+    )
+    master = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", CONF_PATH, "cortex.app.main:app"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_online(base_url)
+        ok = send_predictions(base_url, rounds, 4 * worker_count, pairs)
+        workers = child_pids(master.pid)
+        return {
+            "ok": ok,
+            "master": read_memory_kb(master.pid),
+            "workers": [read_memory_kb(pid) for pid in workers],
+        }
+    finally:
+        master.send_signal(signal.SIGTERM)
+        master.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS/PSS per Cortex API worker as the worker count grows.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--rounds", type=int, default=2, help="passes over all currency pairs per run")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    from cortex.app.api.v1.endpoints import SUPPORTED_CURRENCIES
+
+    # Every non-EUR currency appears on both sides, so all 29 models are used.
+    currencies = sorted(SUPPORTED_CURRENCIES - {"EUR"})
+    pairs = [(c, currencies[(i + 1) % len(currencies)]) for i, c in enumerate(currencies)]
+
+    print(
+        f"{'preload':>7} | {'workers':>7} | {'requests':>8} | {'master RSS':>10} | {'RSS/worker':>10} | "
+        f"{'PSS/worker':>10} | {'total PSS':>10}  (MiB)"
+    )
+    for worker_count in args.workers:
+        for preload in (True, False):
+            report = measure(worker_count, preload, args.port, args.rounds, pairs)
+            workers = report["workers"]
+            rss = sum(w["Rss"] for w in workers) / max(len(workers), 1)
+            pss = sum(w["Pss"] for w in workers) / max(len(workers), 1)
+            total_pss = report["master"]["Pss"] + sum(w["Pss"] for w in workers)
+            print(
+                f"{'on' if preload else 'off':>7} | {len(workers):>7} | {report['ok']:>8} | "
+                f"{report['master']['Rss'] / 1024:>10.1f} | {rss / 1024:>10.1f} | "
+                f"{pss / 1024:>10.1f} | {total_pss / 1024:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
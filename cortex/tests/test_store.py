@@ -0,0 +1,88 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from cortex.app.engine import store
+
+
+@pytest.fixture
+def history_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "HISTORY_DIR", str(tmp_path))
+    monkeypatch.setattr(store, "_MAPPED", {})
+    return tmp_path
+
+
+@pytest.fixture(params=["Europe/Berlin", "America/New_York", "UTC"])
+def local_tz(request, monkeypatch):
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _history(rows: int = 300):
+    index = pd.bdate_range("2023-01-02", periods=rows)
+    return pd.DataFrame({"Close": np.linspace(1.0, 2.0, rows)}, index=index)
+
+
+def _age(path, seconds: float):
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_ttl_uses_real_file_age(history_dir, local_tz, monkeypatch):
+    store._write_history("GBP", _history())
+    path = store._history_path("GBP")
+    calls = []
+    monkeypatch.setattr(store, "fetch_data", lambda ticker, timeout: calls.append(ticker) or _history())
+
+    _age(path, 30 * 60)
+    assert store.refresh_history("GBP")
+    assert calls == []
+
+    _age(path, 90 * 60)
+    assert store.refresh_history("GBP")
+    assert calls == ["EURGBP"]
+
+
+def test_failed_refresh_backs_off_and_success_clears_marker(history_dir, local_tz, monkeypatch):
+    store._write_history("GBP", _history())
+    path = store._history_path("GBP")
+    _age(path, 2 * 60 * 60)
+    calls = []
+    monkeypatch.setattr(store, "fetch_data", lambda ticker, timeout: calls.append(ticker))
+
+    # The stale copy is still served, and one failure stops further attempts for a while.
+    assert store.refresh_history("GBP")
+    assert store.refresh_history("GBP")
+    assert calls == ["EURGBP"]
+
+    _age(f"{path}.failed", store.RETRY_AFTER.total_seconds() + 1)
+    monkeypatch.setattr(store, "fetch_data", lambda ticker, timeout: _history())
+    assert store.refresh_history("GBP")
+    assert not os.path.exists(f"{path}.failed")
+
+
+def test_failed_refresh_without_copy_retries_sooner(history_dir, monkeypatch):
+    path = store._history_path("GBP")
+    monkeypatch.setattr(store, "fetch_data", lambda ticker, timeout: None)
+    assert not store.refresh_history("GBP")
+
+    _age(f"{path}.failed", store.RETRY_AFTER_NO_COPY.total_seconds() + 1)
+    monkeypatch.setattr(store, "fetch_data", lambda ticker, timeout: _history())
+    assert store.refresh_history("GBP")
+    assert len(store.load_history("GBP", refresh=False)) == 300
+
+
+def test_load_history_without_refresh_never_fetches(history_dir, monkeypatch):
+    monkeypatch.setattr(store, "fetch_data", lambda ticker, timeout: pytest.fail("fetched"))
+    assert store.load_history("GBP", refresh=False) is None
+
+    df = _history()
+    store._write_history("GBP", df)
+    _age(store._history_path("GBP"), 2 * 60 * 60)
+    mapped = store.load_history("GBP", refresh=False)
+    assert mapped.index.equals(df.index)
+    assert np.allclose(mapped["Close"], df["Close"])